@@ -1,15 +1,65 @@
 #!/usr/bin/env python3
-from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, Any, Optional, List, Tuple
+from collections import deque
+from dataclasses import dataclass, replace
+import functools
 import logging
 import os
-from datetime import datetime
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import kopf
 import ipaddress
-import pytz
+import re
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    _json_loads = json.loads
+
+_log = logging.getLogger('netbird_operator')
+
+# Rate limiting and transient gateway errors on idempotent calls are retried
+# in-connection instead of failing the whole handler. POST is excluded so the
+# adapter itself never re-sends a create; a POST that times out still surfaces
+# as a TemporaryError and kopf re-runs the create handler. Retry-After is
+# ignored so a server-chosen delay cannot pin handler threads beyond backoff.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'PUT', 'DELETE']),
+    respect_retry_after_header=False
+)
+
+# (connect, read) timeouts for Netbird API calls
+REQUEST_TIMEOUT = (3.05, 15)
+
+_IPV4_OCTET = r'(25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])'
+_IPV4_CIDR = re.compile(rf'{_IPV4_OCTET}\.{_IPV4_OCTET}\.{_IPV4_OCTET}\.{_IPV4_OCTET}/(3[0-2]|[12]?[0-9])')
+
+@functools.lru_cache(maxsize=4096)
+def _validate_network(network: str) -> None:
+    """Validate a network CIDR, caching the result for repeated reconciles"""
+    # Fast path for the common canonical IPv4 CIDR; anything else (IPv6, no
+    # prefix, host bits set) goes through ipaddress for the exact error.
+    match = _IPV4_CIDR.fullmatch(network)
+    if match:
+        a, b, c, d, prefix = (int(g) for g in match.groups())
+        address = (a << 24) | (b << 16) | (c << 8) | d
+        if address & ((1 << (32 - prefix)) - 1) == 0:
+            return
+    ipaddress.ip_network(network)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GroupSpec:
     """Data class to validate and hold group specifications"""
     name: str
@@ -20,7 +70,7 @@ class GroupSpec:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GroupSpec':
         """Create GroupSpec from dictionary, ensuring required fields exist"""
-        logging.debug(f"Creating GroupSpec from data: {data}")
+        _log.debug("Creating GroupSpec from data: %s", data)
         
         # Validate name field
         name = data.get('name')
@@ -55,7 +105,11 @@ class GroupSpec:
             
         return result
 
-@dataclass
+    def to_json(self) -> bytes:
+        """Serialize to the JSON request body sent to the API"""
+        return _json_dumps(self.to_dict())
+
+@dataclass(slots=True, frozen=True)
 class RouteSpec:
     """Data class to validate and hold route specifications"""
     network: str
@@ -71,7 +125,7 @@ class RouteSpec:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RouteSpec':
         """Create RouteSpec from dictionary, ensuring required fields exist"""
-        logging.debug(f"Creating RouteSpec from data: {data}")
+        _log.debug("Creating RouteSpec from data: %s", data)
         
         # Validate peerId field exists and convert to peer
         peer = data.get('peerId') or data.get('peer')
@@ -84,7 +138,7 @@ class RouteSpec:
             raise ValueError("network is required")
         
         try:
-            ipaddress.ip_network(network)
+            _validate_network(network)
         except ValueError as e:
             raise ValueError(f"Invalid network format: {network}. Error: {str(e)}")
 
@@ -130,122 +184,156 @@ class RouteSpec:
             
         return result
 
+    def to_json(self) -> bytes:
+        """Serialize to the JSON request body sent to the API"""
+        return _json_dumps(self.to_dict())
+
 class NetbirdClient:
     """Client for interacting with Netbird API"""
-    def __init__(self, api_key: str):
-        self.netbird_url = os.environ.get('NETBIRD_URL')
-        if not self.netbird_url:
-            raise ValueError("NETBIRD_URL environment variable is required")
-            
+    def __init__(self, netbird_url: str, api_key: str):
+        self.netbird_url = netbird_url
         self.base_url = self.netbird_url.rstrip('/')
+        self._routes_url = f"{self.base_url}/routes"
+        self._groups_url = f"{self.base_url}/groups"
         self.api_key = api_key
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
-
-    def _make_request(self, method: str, endpoint: str, data: Optional[dict] = None) -> dict:
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        # Per-client session so connections to the Netbird API are pooled and
+        # kept alive across handler invocations, and the headers (including
+        # this client's API key) are set once rather than merged per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_RETRY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _make_request(self, method: str, url: str, data: Optional[bytes] = None) -> dict:
+        # Checked once per call so no debug work happens when DEBUG is off
+        debug = _log.isEnabledFor(logging.DEBUG)
         try:
-            logging.debug(f"Making {method} request to {url}")
-            logging.debug(f"Headers (partially redacted): {{'Authorization': 'Bearer ...{self.api_key[-8:]}'}}")
-            if data:
-                logging.debug(f"Request payload: {data}")
+            if debug:
+                _log.debug("Making %s request to %s", method, url)
+                _log.debug("Headers (partially redacted): {'Authorization': 'Bearer ...%s'}", self.api_key[-8:])
+                if data:
+                    _log.debug("Request payload: %s", data.decode())
             
-            response = requests.request(method, url, headers=self.headers, json=data)
+            response = self.session.request(method, url, data=data, timeout=REQUEST_TIMEOUT)
             
-            logging.debug(f"Response status: {response.status_code}")
+            # Parse the body once; None marks a non-JSON body
+            parsed: Any = {}
             if response.content:
                 try:
-                    logging.debug(f"Response body: {response.json()}")
+                    parsed = _json_loads(response.content)
                 except ValueError:
-                    logging.debug(f"Response body (raw): {response.text}")
+                    parsed = None
+
+            if debug:
+                _log.debug("Response status: %s", response.status_code)
+                if parsed is None:
+                    _log.debug("Response body (raw): %s", response.text)
+                elif response.content:
+                    _log.debug("Response body: %s", parsed)
             
             if response.status_code == 422:
-                error_detail = "No error details available"
-                try:
-                    error_detail = response.json()
-                except ValueError:
-                    error_detail = response.text
-                logging.error(f"422 Validation Error. Request payload: {data}")
-                logging.error(f"Response details: {error_detail}")
+                error_detail = parsed or response.text or "No error details available"
+                _log.error("422 Validation Error. Request payload: %s", data.decode() if data else None)
+                _log.error("Response details: %s", error_detail)
                 raise kopf.PermanentError(f"API validation failed: {error_detail}")
             
             response.raise_for_status()
-            return response.json() if response.content else {}
+            if parsed is None:
+                # A ValueError like response.json() raised, so handlers fail
+                # permanently rather than re-sending a create that may have
+                # already succeeded
+                raise requests.exceptions.JSONDecodeError(
+                    f"Invalid JSON in response from {url}", response.text, 0, response=response)
+            return parsed
             
+        except (requests.exceptions.RetryError, requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError) as e:
+            # Retries are exhausted or the API is unreachable; let kopf reschedule
+            _log.error("Netbird API unavailable: %s", e)
+            raise kopf.TemporaryError(f"Netbird API unavailable: {e}", delay=60)
+
         except requests.exceptions.RequestException as e:
-            logging.error(f"Request failed: {str(e)}")
+            _log.error("Request failed: %s", e)
             if hasattr(e, 'response') and e.response is not None:
-                logging.error(f"Response status code: {e.response.status_code}")
-                logging.error(f"Response body: {e.response.text}")
+                _log.error("Response status code: %s", e.response.status_code)
+                _log.error("Response body: %s", e.response.text)
             raise
 
     def create_route(self, route_spec: RouteSpec) -> Dict[str, Any]:
         """Create a new route"""
-        return self._make_request("POST", "/routes", route_spec.to_dict())
+        return self._make_request("POST", self._routes_url, route_spec.to_json())
 
     def update_route(self, route_id: str, route_spec: RouteSpec) -> Dict[str, Any]:
         """Update an existing route"""
-        existing_route = self.get_route(route_id)
-        logging.debug(f"Existing route: {existing_route}")
-        route_spec.id = existing_route['id']
-        return self._make_request("PUT", f"/routes/{route_id}", route_spec.to_dict())
+        # route_id comes from the CR's status.resourceId, which is the id the
+        # API returned on create, so no preflight GET is needed to look it up
+        route_spec = replace(route_spec, id=route_id)
+        return self._make_request("PUT", f"{self._routes_url}/{route_id}", route_spec.to_json())
 
     def delete_route(self, route_id: str) -> None:
         """Delete a route"""
-        self._make_request("DELETE", f"/routes/{route_id}")
+        self._make_request("DELETE", f"{self._routes_url}/{route_id}")
 
     def get_route(self, route_id: str) -> Dict[str, Any]:
         """Get route details"""
-        return self._make_request("GET", f"/routes/{route_id}")
+        return self._make_request("GET", f"{self._routes_url}/{route_id}")
 
     # Group methods
     def create_group(self, group_spec: GroupSpec) -> Dict[str, Any]:
         """Create a new group"""
-        return self._make_request("POST", "/groups", group_spec.to_dict())
+        return self._make_request("POST", self._groups_url, group_spec.to_json())
 
     # def update_group(self, group_id: str, group_spec: GroupSpec) -> Dict[str, Any]:
     #     """Update an existing group"""
-    #     existing_group = self.get_group(group_id)
-    #     logging.debug(f"Existing group: {existing_group}")
-    #     group_spec.id = existing_group['id']
-    #     return self._make_request("PUT", f"/groups/{group_id}", group_spec.to_dict())
+    #     group_spec = replace(group_spec, id=group_id)
+    #     return self._make_request("PUT", f"{self._groups_url}/{group_id}", group_spec.to_json())
 
     def delete_group(self, group_id: str) -> None:
         """Delete a group"""
-        self._make_request("DELETE", f"/groups/{group_id}")
+        self._make_request("DELETE", f"{self._groups_url}/{group_id}")
 
     # def get_group(self, group_id: str) -> Dict[str, Any]:
     #     """Get group details"""
-    #     return self._make_request("GET", f"/groups/{group_id}")
+    #     return self._make_request("GET", f"{self._groups_url}/{group_id}")
 
     # def list_groups(self) -> List[Dict[str, Any]]:
     #     """List all groups"""
-    #     return self._make_request("GET", "/groups")
+    #     return self._make_request("GET", self._groups_url)
 
-def format_datetime(dt: datetime) -> str:
-    """Format datetime in RFC3339 format with timezone"""
-    if dt.tzinfo is None:
-        dt = pytz.UTC.localize(dt)
-    return dt.isoformat().replace('+00:00', 'Z')
+# (epoch second, formatted timestamp) of the most recent status timestamp
+_TIMESTAMP_CACHE: Tuple[int, str] = (0, '')
+
+def utc_now_iso() -> str:
+    """Current UTC time in RFC3339 format, formatted at most once per second"""
+    global _TIMESTAMP_CACHE
+    second = int(time.time())
+    cached_second, timestamp = _TIMESTAMP_CACHE
+    if second != cached_second:
+        timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(second))
+        _TIMESTAMP_CACHE = (second, timestamp)
+    return timestamp
 
 def create_status_body(status: str, reason: str, message: str, resource_id: Optional[str] = None,
                       meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Create a standardized status body with properly formatted timestamps"""
-    current_time = datetime.utcnow()
+    now = utc_now_iso()
     
     new_condition = {
         'type': 'Ready',
         'status': status,
-        'lastTransitionTime': format_datetime(current_time),
+        'lastTransitionTime': now,
         'reason': reason,
         'message': message
     }
     
     result = {
         'conditions': [new_condition],
-        'lastSync': format_datetime(current_time),
+        'lastSync': now,
         'status': status,
         'reason': reason
     }
@@ -261,28 +349,8 @@ def create_status_body(status: str, reason: str, message: str, resource_id: Opti
 def create_status_condition(status: str, reason: str, message: str, resource_id: Optional[str] = None,
                           meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Create a standardized status condition for Kopf status field"""
-    new_condition = {
-        'type': 'Ready',
-        'status': status,
-        'lastTransitionTime': datetime.utcnow().isoformat(),
-        'reason': reason,
-        'message': message
-    }
-    
-    result = {
-        'conditions': [new_condition],
-        'lastSync': datetime.utcnow().isoformat(),
-        'status': status,
-        'reason': reason
-    }
-    
-    if resource_id:
-        result['resourceId'] = resource_id
-        
-    if meta:
-        result['observedGeneration'] = meta.get('generation', 0)
-    
-    return {'status': result}  # Wrap in status field for kopf
+    body = create_status_body(status, reason, message, resource_id=resource_id, meta=meta)
+    return {'status': body}  # Wrap in status field for kopf
 
 def update_status_conditions(current_status: Dict[str, Any], new_condition: Dict[str, Any]) -> Dict[str, Any]:
     """Update status conditions list, maintaining history and avoiding duplicates"""
@@ -291,24 +359,20 @@ def update_status_conditions(current_status: Dict[str, Any], new_condition: Dict
     
     conditions = current_status.get('conditions', [])
     
-    # Check if we have a condition of the same type
-    existing_condition = None
-    for condition in conditions:
-        if condition['type'] == new_condition['type']:
-            existing_condition = condition
-            break
+    # Compare against the most recent condition of the same type; the list is
+    # history in append order, so scan from the end and stop at the first hit
+    latest_condition = next(
+        (c for c in reversed(conditions) if c['type'] == new_condition['type']), None
+    )
     
     # Only append if status or reason changed
-    should_append = True
-    if existing_condition:
-        if (existing_condition['status'] == new_condition['status'] and 
-            existing_condition['reason'] == new_condition['reason']):
-            should_append = False
-    
-    if should_append:
-        conditions.append(new_condition)
+    if (latest_condition is None or
+            latest_condition['status'] != new_condition['status'] or
+            latest_condition['reason'] != new_condition['reason']):
         # Keep only last 10 conditions
-        conditions = conditions[-10:]
+        history = deque(conditions, maxlen=10)
+        history.append(new_condition)
+        conditions = list(history)
     
     current_status['conditions'] = conditions
     # Update top-level status fields for printer columns
@@ -318,40 +382,49 @@ def update_status_conditions(current_status: Dict[str, Any], new_condition: Dict
     return current_status
 
 @kopf.on.startup()
-def configure(settings: kopf.OperatorSettings, **_):
+def configure(settings: kopf.OperatorSettings, memo: kopf.Memo, **_):
     """Configure the operator settings"""
+    api_key = os.environ.get('NETBIRD_API_KEY')
+    if not api_key:
+        raise kopf.PermanentError("NETBIRD_API_KEY environment variable is required")
+
+    netbird_url = os.environ.get('NETBIRD_URL')
+    if not netbird_url:
+        raise kopf.PermanentError("NETBIRD_URL environment variable is required")
+
+    # Shared by all handlers through kopf's operator-wide memo
+    memo.client = NetbirdClient(netbird_url, api_key)
+
     settings.watching.server_timeout = 270
-    settings.posting.level = logging.DEBUG
+    # Sync handlers run in kopf's thread pool; size it so Netbird calls for
+    # different resources proceed in parallel
+    settings.execution.max_workers = int(os.environ.get('MAX_CONCURRENT_RECONCILES', '10'))
+    settings.posting.level = logging.INFO
     settings.watching.cluster_scope = True
     
+    log_level = getattr(logging, os.environ.get('LOG_LEVEL', 'INFO').upper(), logging.INFO)
     logging.basicConfig(
-        level=logging.DEBUG,
+        level=log_level,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    logging.getLogger("urllib3").setLevel(logging.INFO)
-
-@kopf.on.create('gitops.netbird.io', 'v1alpha1', 'networkroutes')
-def create_fn(spec: Dict[str, Any], meta: Dict[str, Any], status: Dict[str, Any],
-              patch: Dict[str, Any], logger: logging.Logger, **kwargs):
-    """Handle creation of new Netbird routes"""
-    logger.info("Starting route creation")
-    
+    # `kopf run` has already configured the root logger, so basicConfig
+    # alone would not change its level
+    logging.getLogger().setLevel(log_level)
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+def _reconcile(kind: str, action: str, operation: Callable[[], Dict[str, Any]],
+               meta: Dict[str, Any], patch: Dict[str, Any]) -> None:
+    """Run a create/update API operation and record its outcome in the status patch"""
     try:
-        api_key = os.environ.get('NETBIRD_API_KEY')
-        if not api_key:
-            raise kopf.PermanentError("NETBIRD_API_KEY environment variable is required")
-
-        client = NetbirdClient(api_key)
-        route_spec = RouteSpec.from_dict(spec)
-        route = client.create_route(route_spec)
+        resource = operation()
         
         # Update status with properly formatted timestamps
         patch.update({
             'status': create_status_body(
                 status='True',
-                reason='RouteCreated',
-                message=f"Route {route['id']} created successfully",
-                resource_id=route['id'],
+                reason=f"{kind}{action}",
+                message=f"{kind} {resource['id']} {action.lower()} successfully",
+                resource_id=resource['id'],
                 meta=meta
             )
         })
@@ -367,6 +440,17 @@ def create_fn(spec: Dict[str, Any], meta: Dict[str, Any], status: Dict[str, Any]
         })
         raise kopf.PermanentError(str(e))
         
+    except kopf.PermanentError as e:
+        patch.update({
+            'status': create_status_body(
+                status='False',
+                reason='Error',
+                message=str(e),
+                meta=meta
+            )
+        })
+        raise
+        
     except Exception as e:
         patch.update({
             'status': create_status_body(
@@ -378,75 +462,42 @@ def create_fn(spec: Dict[str, Any], meta: Dict[str, Any], status: Dict[str, Any]
         })
         raise kopf.TemporaryError(str(e), delay=60)
 
-@kopf.on.update('gitops.netbird.io', 'v1alpha1', 'networkroutes')
+@kopf.on.create('gitops.netbird.io', 'v1alpha1', 'networkroutes')
+def create_fn(spec: Dict[str, Any], meta: Dict[str, Any], status: Dict[str, Any],
+              patch: Dict[str, Any], logger: logging.Logger, memo: kopf.Memo, **kwargs):
+    """Handle creation of new Netbird routes"""
+    logger.info("Starting route creation")
+    client = memo.client
+    _reconcile('Route', 'Created', lambda: client.create_route(RouteSpec.from_dict(spec)),
+               meta, patch)
+
+# field='spec' makes kopf skip metadata/status-only changes before calling us;
+# old/new are then the spec values themselves
+@kopf.on.update('gitops.netbird.io', 'v1alpha1', 'networkroutes', field='spec')
 def update_fn(spec: Dict[str, Any], status: Dict[str, Any], meta: Dict[str, Any],
               old: Dict[str, Any], new: Dict[str, Any], patch: Dict[str, Any], 
-              logger: logging.Logger, **kwargs):
+              logger: logging.Logger, memo: kopf.Memo, **kwargs):
     """Handle updates to existing Netbird routes"""
     logger.info("Starting route update")
-    
-    if old.get('spec') == new.get('spec'):
-        logger.info("No changes detected in spec, skipping update")
-        return
+    logger.debug("Old spec: %s", old)
+    client = memo.client
 
-    try:
-        api_key = os.environ.get('NETBIRD_API_KEY')
-        if not api_key:
-            raise kopf.PermanentError("NETBIRD_API_KEY environment variable is required")
-
-        client = NetbirdClient(api_key)
-        
+    def update() -> Dict[str, Any]:
         route_id = status.get('resourceId')
         if not route_id:
             raise kopf.PermanentError("No route ID found in status")
+        return client.update_route(route_id, RouteSpec.from_dict(spec))
 
-        route_spec = RouteSpec.from_dict(spec)
-        route = client.update_route(route_id, route_spec)
-        
-        patch.update({
-            'status': create_status_body(
-                status='True',
-                reason='RouteUpdated',
-                message=f"Route {route['id']} updated successfully",
-                resource_id=route['id'],
-                meta=meta
-            )
-        })
-        
-    except ValueError as e:
-        patch.update({
-            'status': create_status_body(
-                status='False',
-                reason='ValidationError',
-                message=str(e),
-                meta=meta
-            )
-        })
-        raise kopf.PermanentError(str(e))
-        
-    except Exception as e:
-        patch.update({
-            'status': create_status_body(
-                status='False',
-                reason='Error',
-                message=str(e),
-                meta=meta
-            )
-        })
-        raise kopf.TemporaryError(str(e), delay=60)
+    _reconcile('Route', 'Updated', update, meta, patch)
 
 @kopf.on.delete('gitops.netbird.io', 'v1alpha1', 'networkroutes')
 def delete_fn(spec: Dict[str, Any], status: Dict[str, Any], patch: Dict[str, Any],
-              logger: logging.Logger, **kwargs):
+              logger: logging.Logger, memo: kopf.Memo, **kwargs):
     """Handle deletion of Netbird routes"""
     logger.info("Starting route deletion")
     
     try:
-        api_key = os.environ.get('NETBIRD_API_KEY')
-        if not api_key:
-            raise kopf.PermanentError("NETBIRD_API_KEY environment variable is required")
-
-        client = NetbirdClient(api_key)
+        client = memo.client
         
         route_id = status.get('resourceId')
         if not route_id:
@@ -466,6 +517,9 @@ def delete_fn(spec: Dict[str, Any], status: Dict[str, Any], patch: Dict[str, Any
             )
         })
         
+    except kopf.TemporaryError:
+        raise
+
     except Exception as e:
         error_msg = f"Failed to delete route: {str(e)}"
         logger.error(error_msg)
@@ -474,63 +528,21 @@ def delete_fn(spec: Dict[str, Any], status: Dict[str, Any], patch: Dict[str, Any
 # Group Handlers
 @kopf.on.create('gitops.netbird.io', 'v1alpha1', 'groups')
 def create_group_fn(spec: Dict[str, Any], meta: Dict[str, Any], status: Dict[str, Any],
-                   patch: Dict[str, Any], logger: logging.Logger, **kwargs):
+                   patch: Dict[str, Any], logger: logging.Logger, memo: kopf.Memo, **kwargs):
     """Handle creation of new Netbird groups"""
     logger.info(f"Starting group creation for {meta['name']}")
-    
-    try:
-        api_key = os.environ.get('NETBIRD_API_KEY')
-        if not api_key:
-            raise kopf.PermanentError("NETBIRD_API_KEY environment variable is required")
-
-        client = NetbirdClient(api_key)
-        group_spec = GroupSpec.from_dict(spec)
-        group = client.create_group(group_spec)
-        
-        patch.update({
-            'status': create_status_body(
-                status='True',
-                reason='GroupCreated',
-                message=f"Group {group['id']} created successfully",
-                resource_id=group['id'],
-                meta=meta
-            )
-        })
-        
-    except ValueError as e:
-        patch.update({
-            'status': create_status_body(
-                status='False',
-                reason='ValidationError',
-                message=str(e),
-                meta=meta
-            )
-        })
-        raise kopf.PermanentError(str(e))
-        
-    except Exception as e:
-        patch.update({
-            'status': create_status_body(
-                status='False',
-                reason='Error',
-                message=str(e),
-                meta=meta
-            )
-        })
-        raise kopf.TemporaryError(str(e), delay=60)
+    client = memo.client
+    _reconcile('Group', 'Created', lambda: client.create_group(GroupSpec.from_dict(spec)),
+               meta, patch)
 
 @kopf.on.delete('gitops.netbird.io', 'v1alpha1', 'groups')
 def delete_group_fn(spec: Dict[str, Any], status: Dict[str, Any], meta: Dict[str, Any],
-                   patch: Dict[str, Any], logger: logging.Logger, **kwargs):
+                   patch: Dict[str, Any], logger: logging.Logger, memo: kopf.Memo, **kwargs):
     """Handle deletion of Netbird groups"""
     logger.info(f"Starting group deletion for {meta['name']}")
     
     try:
-        api_key = os.environ.get('NETBIRD_API_KEY')
-        if not api_key:
-            raise kopf.PermanentError("NETBIRD_API_KEY environment variable is required")
-
-        client = NetbirdClient(api_key)
+        client = memo.client
         
         group_id = status.get('resourceId')
         if not group_id:
@@ -558,6 +570,9 @@ def delete_group_fn(spec: Dict[str, Any], status: Dict[str, Any], meta: Dict[str
             else:
                 raise
                 
+    except kopf.TemporaryError:
+        raise
+
     except Exception as e:
         error_msg = f"Failed to delete group: {str(e)}"
         logger.error(error_msg)